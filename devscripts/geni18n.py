@@ -18,11 +18,12 @@ catalog.
 """
 
 
-import subprocess
 import sys
 from pathlib import Path
 
+import polib
 import wx
+from babel.messages.frontend import CommandLineInterface
 
 __packagename__ = "youtube_dl_gui"
 
@@ -39,39 +40,43 @@ supportedLang = [lang for lang in supLang if lang != "en_US"]
 
 PATH = Path(__file__).resolve().parent
 appFolder = PATH.parent.joinpath(__packagename__)
+outFolder = appFolder.joinpath("locale")
 
-# setup some stuff to get at Python I18N tools/utilities
 
-pyPath = Path(sys.executable).resolve()
-pyExe = pyPath.name
-pyFolder = pyPath.parent
-pyToolsFolder = pyFolder.joinpath("Tools")
-pyI18nFolder = pyToolsFolder.joinpath("i18n")
-pyGettext = pyI18nFolder.joinpath("pygettext.py")
-pyMsgfmt = pyI18nFolder.joinpath("msgfmt.py")
-outFolder = appFolder.joinpath("locale")
+def build_pot(app_folder, out_folder, domain):
+    """Extract the messages of app_folder into out_folder/<domain>.pot"""
+    cmd = [
+        "pybabel",
+        "extract",
+        "-o",
+        str(out_folder.joinpath(f"{domain}.pot")),
+        str(app_folder),
+    ]
+
+    print("Generating the .pot file")
+    print(f"cmd: {' '.join(cmd)}")
 
-# build command for pygettext
-gtOptions = f"-a -d {langDomain} -o {langDomain}.pot -p {outFolder} {appFolder}"
-tCmd = f"{pyExe} {pyGettext} {gtOptions}"
+    try:
+        CommandLineInterface().run(cmd)
+    except OSError as error:
+        sys.exit(f"{error}, exiting...")
 
-print("Generating the .pot file")
-print(f"cmd: {tCmd}")
-rCode = subprocess.call(tCmd)
 
-if rCode != 0:
-    sys.exit(f"return code: {rCode}")
+def build_mo_all(app_folder, langs, domain):
+    """Compile the <domain>.po catalog of every language in langs"""
+    try:
+        for lang in langs:
+            lang_dir = app_folder.joinpath(f"locale/{lang}/LC_MESSAGES")
+            po_file = lang_dir.joinpath(domain).with_suffix(".po")
+            mo_file = po_file.with_suffix(".mo")
 
-print("")
+            print(f"Generating the .mo file for '{po_file}'")
+            polib.pofile(str(po_file)).save_as_mofile(str(mo_file))
+    except OSError as error:
+        sys.exit(f"{error}, exiting...")
 
-for tLang in supportedLang:
-    # build command for msgfmt
-    langDir = appFolder.joinpath(f"locale/{tLang}/LC_MESSAGES")
-    poFile = langDir.joinpath(langDomain).with_suffix(".po")
-    tCmd = f"{pyExe} {pyMsgfmt} {poFile}"
 
-    print("Generating the .mo file")
-    print(f"cmd: {tCmd}")
-    rCode = subprocess.call(tCmd)
-    if rCode != 0:
-        sys.exit(f"return code: {rCode}")
+if __name__ == "__main__":
+    build_pot(appFolder, outFolder, langDomain)
+    print("")
+    build_mo_all(appFolder, supportedLang, langDomain)
@@ -51,7 +51,7 @@ def main(lang_code):
     os.makedirs(target_dir)
 
     output(f"Creating PO file: '{target_po}'")
-    shutil.copy(source_po, target_po)
+    shutil.copyfile(source_po, target_po)
 
     output("Done")
 
@@ -40,7 +40,7 @@ Examples:
 """
 
 
-import glob
+import ast
 import importlib
 import logging
 import os
@@ -48,24 +48,42 @@ import re
 import subprocess
 import sys
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 from setuptools import Command, setup
 
-try:
-    import youtube_dl_gui
-except ModuleNotFoundError:
-    # For editable mode
-    HERE = Path(__file__).resolve().parent
-    sys.path.insert(0, str(HERE))
-    import youtube_dl_gui
+HERE = Path(__file__).resolve().parent
+
+
+@lru_cache(maxsize=None)
+def load_vars(path):
+    """Return the module level constants assigned in the given file"""
+    tree = ast.parse(Path(path).read_bytes())
+
+    return {
+        target.id: node.value.value
+        for node in tree.body
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+        for target in node.targets
+        if isinstance(target, ast.Name)
+    }
+
+
+# Package metadata without importing the package
+vars_file = {
+    **load_vars(HERE / "youtube_dl_gui" / "info.py"),
+    **load_vars(HERE / "youtube_dl_gui" / "version.py"),
+}
+
+IS_WINDOWS = os.name == "nt"
 
 PYINSTALLER = len(sys.argv) >= 2 and sys.argv[1] == "pyinstaller"
 
 try:
     from PyInstaller import compat as pyi_compat
 
-    if pyi_compat.is_win:
+    if IS_WINDOWS:
         # noinspection PyUnresolvedReferences
         from PyInstaller.utils.win32.versioninfo import (
             FixedFileInfo,
@@ -84,14 +102,19 @@ except ImportError:
         exit(1)
 
 
-DESCRIPTION = youtube_dl_gui.__description__
-LONG_DESCRIPTION = open("README.md", encoding="utf-8").read()
+# Commands that never use the package long description
+NO_METADATA_COMMANDS = {"build_trans", "no_updates", "pyinstaller", "-h", "--help"}
 
-IS_WINDOWS = os.name == "nt"
+DESCRIPTION = vars_file["__description__"]
+LONG_DESCRIPTION = ""
+
+if not set(sys.argv[1:]) <= NO_METADATA_COMMANDS:
+    LONG_DESCRIPTION = Path("README.md").read_bytes().decode("utf-8")
 
 
+@lru_cache(maxsize=1)
 def version2tuple(commit=0):
-    version_list = str(youtube_dl_gui.__version__).split(".")
+    version_list = str(vars_file["__version__"]).split(".")
 
     if len(version_list) > 3:
         del version_list[3]
@@ -102,6 +125,7 @@ def version2tuple(commit=0):
     return _year, _month, _day, _release
 
 
+@lru_cache(maxsize=1)
 def version2str(commit=0):
     version_tuple = version2tuple(commit)
     return "%s.%s.%s.%s" % version_tuple
@@ -111,35 +135,65 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+def _mo_file(po_file):
+    """Return the .mo path that corresponds to the given .po file"""
+    return os.path.splitext(po_file)[0] + ".mo"
+
+
+def _compile_po(po_file):
+    """Compile a single .po file to its .mo counterpart"""
+    import polib
+
+    # All the catalogs are UTF-8, skip polib's charset detection pass
+    polib.pofile(po_file, encoding="utf-8").save_as_mofile(_mo_file(po_file))
+
+
 # noinspection PyAttributeOutsideInit,PyArgumentList
 class BuildTranslations(Command):
     description = "Build the translation files"
-    user_options = []
+    user_options = [("force", "f", "rebuild the .mo files even if they are up to date")]
+    boolean_options = ["force"]
 
     def initialize_options(self):
-        self.search_pattern = None
+        self.locale_root = None
+        self.force = False
 
     def finalize_options(self):
-        self.search_pattern = os.path.join(
-            youtube_dl_gui.__packagename__,
-            "locale",
-            "*",
-            "LC_MESSAGES",
-            "youtube_dl_gui.po",
-        )
-
-    def run(self):
-        import polib
+        self.locale_root = Path(vars_file["__packagename__"], "locale")
 
-        po_file = ""
+    def _is_outdated(self, po_file):
+        """Return True if the .mo file is missing or older than the .po file"""
+        if self.force:
+            return True
 
         try:
-            for po_file in glob.glob(self.search_pattern):
-                mo_file = po_file.replace(".po", ".mo")
-                po = polib.pofile(po_file)
+            mo_mtime = os.stat(_mo_file(po_file)).st_mtime_ns
+        except FileNotFoundError:
+            return True
 
+        return mo_mtime < os.stat(po_file).st_mtime_ns
+
+    def _po_files(self):
+        """Return the .po files under locale_root that need to be compiled"""
+        po_files = []
+
+        with os.scandir(self.locale_root) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+
+                po_file = os.path.join(entry.path, "LC_MESSAGES", "youtube_dl_gui.po")
+
+                if os.path.isfile(po_file) and self._is_outdated(po_file):
+                    po_files.append(po_file)
+
+        return po_files
+
+    def run(self):
+        try:
+            for po_file in self._po_files():
                 logger.info(f"Building MO file for '{po_file}'")
-                po.save_as_mofile(mo_file)
+                _compile_po(po_file)
         except OSError as error:
             logger.error(f"{error}, exiting...")
             sys.exit(1)
@@ -160,33 +214,54 @@ class BuildNoUpdate(Command):
         self.__disable_updates()
 
     def __disable_updates(self):
-        lib_dir = os.path.join(self.build_lib, youtube_dl_gui.__packagename__)
+        lib_dir = os.path.join(self.build_lib, vars_file["__packagename__"])
         target_file = "optionsmanager.py"
         # Options file should be available from previous build commands
-        optionsfile = os.path.join(lib_dir, target_file)
+        optionsfile = Path(lib_dir, target_file)
+
+        data = optionsfile.read_bytes()
+        needle = b'"disable_update": False'
 
-        with open(optionsfile) as input_file:
-            data = input_file.readlines()
+        if needle not in data:
+            if b'"disable_update": True' in data:
+                logger.info("Updates already disabled")
+                return
 
-        if data is None:
             logger.error("Building with updates disabled failed!")
             sys.exit(1)
 
-        for index, line in enumerate(data):
-            if '"disable_update": False' in line:
-                logger.info("Disabling updates...")
-                data[index] = line.replace("False", "True")
-                break
-
-        with open(optionsfile, "w") as output_file:
-            output_file.writelines(data)
+        logger.info("Disabling updates...")
+        optionsfile.write_bytes(data.replace(needle, b'"disable_update": True', 1))
+
+
+PKG_NAME = vars_file["__packagename__"]
+PATH_SEP = ";" if IS_WINDOWS else ":"
+
+PYI_ARGV = (
+    "pyinstaller",
+    "-w",
+    "-F",
+    "--noconfirm",
+    # Keep the same work/dist/spec paths to reuse the build cache
+    "--workpath=build",
+    "--distpath=dist",
+    "--specpath=.",
+    f"--icon={PKG_NAME}/data/pixmaps/youtube-dl-gui.ico",
+    f"--add-data={PKG_NAME}/data{PATH_SEP}{PKG_NAME}/data",
+    f"--add-data={PKG_NAME}/locale{PATH_SEP}{PKG_NAME}/locale",
+    "--exclude-module=tests",
+    "--exclude-module=test",
+    "--exclude-module=tkinter",
+    "--name=yt-dlg",
+    f"{PKG_NAME}/__main__.py",
+)
 
 
 class BuildPyinstallerBin(Command):
     description = "Build the executable"
     user_options = []
     version_file = None
-    if pyi_compat and pyi_compat.is_win:
+    if pyi_compat and IS_WINDOWS:
         version_file = VSVersionInfo(
             ffi=FixedFileInfo(
                 filevers=version2tuple(),
@@ -206,17 +281,17 @@ class BuildPyinstallerBin(Command):
                             "000004b0",
                             [
                                 StringStruct(
-                                    "CompanyName", youtube_dl_gui.__mcontact__
+                                    "CompanyName", vars_file["__mcontact__"]
                                 ),
                                 StringStruct("FileDescription", DESCRIPTION),
                                 StringStruct("FileVersion", version2str()),
                                 StringStruct("InternalName", "yt-dlg.exe"),
                                 StringStruct(
                                     "LegalCopyright",
-                                    f"{youtube_dl_gui.__projecturl__}LICENSE",
+                                    f"{vars_file['__projecturl__']}LICENSE",
                                 ),
                                 StringStruct("OriginalFilename", "yt-dlg.exe"),
-                                StringStruct("ProductName", youtube_dl_gui.__appname__),
+                                StringStruct("ProductName", vars_file["__appname__"]),
                                 StringStruct("ProductVersion", version2str()),
                             ],
                         )
@@ -233,30 +308,7 @@ class BuildPyinstallerBin(Command):
 
     def run(self, version=version_file):
         """Run pyinstaller"""
-        path_sep = ";" if IS_WINDOWS else ":"
-        subprocess.run(
-            [
-                "pyinstaller",
-                "-w",
-                "-F",
-                f"--icon={youtube_dl_gui.__packagename__}/data/pixmaps/youtube-dl-gui.ico",
-                "--add-data="
-                + youtube_dl_gui.__packagename__
-                + "/data"
-                + path_sep
-                + youtube_dl_gui.__packagename__
-                + "/data",
-                "--add-data="
-                + youtube_dl_gui.__packagename__
-                + "/locale"
-                + path_sep
-                + youtube_dl_gui.__packagename__
-                + "/locale",
-                "--exclude-module=tests",
-                "--name=yt-dlg",
-                f"{youtube_dl_gui.__packagename__}/__main__.py",
-            ]
-        )
+        subprocess.run(PYI_ARGV, check=True)
 
         if version:
             SetVersion("./dist/yt-dlg.exe", version)
@@ -269,17 +321,36 @@ cmdclass = {
 
 # Add pixmaps icons (*.png) & i18n files
 package_data = {
-    youtube_dl_gui.__packagename__: ["data/pixmaps/*.png", "locale/*/LC_MESSAGES/*.mo"]
+    vars_file["__packagename__"]: ["data/pixmaps/*.png", "locale/*/LC_MESSAGES/*.mo"]
 }
 
 
+HICOLOR_DIR = "youtube_dl_gui/data/icons/hicolor"
+
+# Hicolor icon folders keyed by the directory mtime
+_ICON_CACHE = {}
+
+
+def hicolor_icons():
+    """Return (size, path) pairs of the hicolor icon folders"""
+    mtime = os.stat(HICOLOR_DIR).st_mtime_ns
+
+    if mtime not in _ICON_CACHE:
+        with os.scandir(HICOLOR_DIR) as entries:
+            _ICON_CACHE[mtime] = [
+                (entry.name, entry.path)
+                for entry in entries
+                if entry.is_dir() and "x" in entry.name
+            ]
+
+    return _ICON_CACHE[mtime]
+
+
 def setup_linux():
     """Setup params for Linux"""
     data_files_linux = []
     # Add hicolor icons
-    for path in glob.glob("youtube_dl_gui/data/icons/hicolor/*x*"):
-        size = os.path.basename(path)
-
+    for size, path in hicolor_icons():
         dst = f"share/icons/hicolor/{size}/apps"
         src = f"{path}/apps/youtube-dl-gui.png"
 
@@ -315,38 +386,38 @@ else:
     params = setup_windows() if IS_WINDOWS else setup_linux()
     params["entry_points"] = {
         "console_scripts": [
-            f"{youtube_dl_gui.__appname__} = {youtube_dl_gui.__packagename__}.app:main"
+            f"{vars_file['__appname__']} = {vars_file['__packagename__']}.app:main"
         ]
     }
 
 
 if __name__ == "__main__":
     setup(
-        name=f"{youtube_dl_gui.__appname__}".replace("-", "_"),
-        version=youtube_dl_gui.__version__,
+        name=f"{vars_file['__appname__']}".replace("-", "_"),
+        version=vars_file["__version__"],
         description=DESCRIPTION,
         long_description=LONG_DESCRIPTION,
         long_description_content_type="text/markdown",
-        url=youtube_dl_gui.__projecturl__,
-        download_url=f"{youtube_dl_gui.__githuburl__}releases/latest",
+        url=vars_file["__projecturl__"],
+        download_url=f"{vars_file['__githuburl__']}releases/latest",
         project_urls={
-            "Source": youtube_dl_gui.__githuburl__,
-            "Tracker": f"{youtube_dl_gui.__githuburl__}issues",
-            "Funding": f"{youtube_dl_gui.__projecturl__}donate.html",
+            "Source": vars_file["__githuburl__"],
+            "Tracker": f"{vars_file['__githuburl__']}issues",
+            "Funding": f"{vars_file['__projecturl__']}donate.html",
         },
-        author=youtube_dl_gui.__author__,
-        author_email=youtube_dl_gui.__contact__,
-        maintainer=youtube_dl_gui.__maintainer__,
-        maintainer_email=youtube_dl_gui.__mcontact__,
-        license=youtube_dl_gui.__license__,
-        packages=[youtube_dl_gui.__packagename__],
+        author=vars_file["__author__"],
+        author_email=vars_file["__contact__"],
+        maintainer=vars_file["__maintainer__"],
+        maintainer_email=vars_file["__mcontact__"],
+        license=vars_file["__license__"],
+        packages=[vars_file["__packagename__"]],
         install_requires=[
             "pypubsub>=4.0.3",
-            "numpy",
             "wxPython<=4.2.1,>=4.0.7.post2",
         ],
         extras_require={
             "binaries": ["polib>=1.1.0", "pyinstaller<=5.12.0,>=3.6"],
+            "i18n": ["babel", "polib>=1.1.0"],
         },
         python_requires=">=3.8",
         classifiers=[
@@ -0,0 +1,56 @@
+"""Shared pytest fixtures for the yt-dlg test suite."""
+
+from pathlib import Path
+
+import pytest
+
+PATH = Path(__file__).parent
+
+# Modules whose tests start real threads
+THREAD_MODULES = {"test_updatemanager"}
+
+
+def pytest_configure(config):
+    # Also registered by pytest-xdist, keep plain pytest runs warning free
+    config.addinivalue_line("markers", "xdist_group(name): run the group on one worker")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep the wx and the threaded tests on one worker under --dist=loadgroup."""
+    for item in items:
+        cls = getattr(item, "cls", None)
+        widget_case = cls is not None and any(
+            base.__name__ == "WidgetTestCase" for base in cls.__mro__
+        )
+
+        if widget_case or "wx_app" in item.fixturenames:
+            item.add_marker(pytest.mark.xdist_group("wx"))
+        elif item.module.__name__.rpartition(".")[2] in THREAD_MODULES:
+            item.add_marker(pytest.mark.xdist_group("threads"))
+
+
+@pytest.fixture(scope="module")
+def wx_app():
+    """wx.App shared by all the tests of a module."""
+    # Imported here so the non GUI tests don't depend on wxPython
+    import wx
+
+    app = wx.App()
+    yield app
+    del app
+
+
+@pytest.fixture
+def frame(wx_app):
+    """Fresh top level frame for every test."""
+    import wx
+
+    _frame = wx.Frame(None)
+    yield _frame
+    _frame.Destroy()
+
+
+@pytest.fixture
+def config_path():
+    """Configuration directory with the test fixtures."""
+    return PATH / "fixtures"
@@ -1,14 +1,8 @@
 """Contains test cases for the ClipDialog in widgets.py module."""
 
-import sys
 import unittest
-from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
-PATH = Path(__file__).parent
-sys.path.insert(0, str(PATH.parent))
-
-
 from tests.wtc import WidgetTestCase
 
 from youtube_dl_gui.downloadmanager import DownloadItem
@@ -81,6 +75,23 @@ class TestClipDialog(WidgetTestCase):
 
         self.assertEqual(self.dlg.download_item.options, ["-f", "flv"])
 
+    def test_clean_options_only_external_downloader(self):
+        """Clean options when nothing else is left"""
+        ditem = DownloadItem("url", [])
+        options = [
+            "--external-downloader",
+            "ffmpeg",
+            "--external-downloader-args",
+            "-ss 70 -to 165",
+        ]
+
+        self.dlg = ClipDialog(cast("MainFrame", self.frame), ditem)
+        self.dlg.download_item.options.extend(options)
+
+        self.dlg._clean_options()
+
+        self.assertEqual(self.dlg.download_item.options, [])
+
     def test_clean_options_extra_args(self):
         """Clean options and extra args in the end"""
         ditem = DownloadItem("url", ["-f", "flv"])
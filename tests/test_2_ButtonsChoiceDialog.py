@@ -1,12 +1,6 @@
 """Contains test cases for the ButtonsChoiceDialog in widgets.py module."""
 
-import sys
 import unittest
-from pathlib import Path
-
-PATH = Path(__file__).parent
-sys.path.insert(0, str(PATH.parent))
-
 
 from tests.wtc import WidgetTestCase
 
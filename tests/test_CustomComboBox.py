@@ -1,126 +1,128 @@
 """Contains test cases for the ListBoxComboPopup in widgets.py module."""
 
-import sys
-import unittest
-from pathlib import Path
-
+import pytest
 import wx
 
-PATH = Path(__file__).parent
-sys.path.insert(0, str(PATH.parent))
-
 from youtube_dl_gui.widgets import ListBoxComboPopup
 
 
-class TestCustomComboBox(unittest.TestCase):
-    """Test cases for the CustomComboBox widget."""
+@pytest.fixture
+def popup_ctrl(frame):
+    combobox = wx.ComboCtrl(frame, size=(180, -1), style=wx.CB_READONLY)
+    _popup_ctrl = ListBoxComboPopup(combobox)
+    combobox.SetPopupControl(_popup_ctrl)
+
+    lb_popup_ctr = _popup_ctrl.GetControl()
+
+    # Call directly the ListBoxWithHeaders methods
+    lb_popup_ctr.add_header("Header")
+    lb_popup_ctr.add_items([f"item{i}" for i in range(10)])
+
+    return _popup_ctrl
+
+
+@pytest.fixture
+def combobox(popup_ctrl):
+    return popup_ctrl.GetComboCtrl()
+
+
+def test_init(frame):
+    choices = ["item0", "item1", "item2"]
+    combobox = wx.ComboCtrl(frame, size=(180, -1), style=wx.CB_READONLY)
+    popup_ctrl = ListBoxComboPopup(combobox)
+    combobox.SetPopupControl(popup_ctrl)
+
+    lb_popup_ctr = popup_ctrl.GetControl()
+    lb_popup_ctr.AppendItems(choices)
+
+    popup_ctrl.SetStringSelection("item1")
+
+    assert popup_ctrl.GetStringValue() == "item1"
+    assert popup_ctrl.GetSelection() == 1
+    assert lb_popup_ctr.GetCount() == 3
+
+
+# wx.ComboBox methods
+# Not all of them since most of them are calls to ListBoxWithHeaders
+# methods and we already have tests for those
+
+
+def test_is_list_empty_false(popup_ctrl):
+    assert not popup_ctrl.IsListEmpty()
 
-    def setUp(self) -> None:
-        self.app = wx.App()
-        self.frame = wx.Frame(None)
 
-        self.combobox = wx.ComboCtrl(self.frame, size=(180, -1), style=wx.CB_READONLY)
-        self._popup_ctrl = ListBoxComboPopup(self.combobox)
-        self.combobox.SetPopupControl(self._popup_ctrl)
+def test_is_list_empty_true(popup_ctrl):
+    popup_ctrl.Clear()
+    assert popup_ctrl.IsListEmpty()
 
-        self._lb_popup_ctr = self._popup_ctrl.GetControl()
 
-        # Call directly the ListBoxWithHeaders methods
-        self._lb_popup_ctr.add_header("Header")
-        self._lb_popup_ctr.add_items([f"item{i}" for i in range(10)])
+def test_is_text_empty_false(combobox):
+    combobox.SetValue("somevalue")
+    assert combobox.GetValue() != ""
 
-    def tearDown(self):
-        self.frame.Destroy()
-        del self.app
 
-    def test_init(self):
-        choices = ["item0", "item1", "item2"]
-        combobox = wx.ComboCtrl(self.frame, size=(180, -1), style=wx.CB_READONLY)
-        popup_ctrl = ListBoxComboPopup(combobox)
-        combobox.SetPopupControl(popup_ctrl)
+def test_is_text_empty_true(combobox):
+    assert combobox.GetValue() == ""
 
-        lb_popup_ctr = popup_ctrl.GetControl()
-        lb_popup_ctr.AppendItems(choices)
 
-        popup_ctrl.SetStringSelection("item1")
+def test_set_selection_item(combobox, popup_ctrl):
+    popup_ctrl.SetSelection(1)
+    assert popup_ctrl.GetSelection() == 1
+    assert combobox.GetValue() == "item0"
 
-        self.assertEqual(popup_ctrl.GetStringValue(), "item1")
-        self.assertEqual(popup_ctrl.GetSelection(), 1)
-        self.assertEqual(lb_popup_ctr.GetCount(), 3)
 
-    # wx.ComboBox methods
-    # Not all of them since most of them are calls to ListBoxWithHeaders
-    # methods and we already have tests for those
+def test_set_selection_header(combobox, popup_ctrl):
+    popup_ctrl.SetSelection(0)
+    assert popup_ctrl.GetSelection() == wx.NOT_FOUND
+    assert combobox.GetValue() == ""
 
-    def test_is_list_empty_false(self):
-        self.assertFalse(self._popup_ctrl.IsListEmpty())
 
-    def test_is_list_empty_true(self):
-        self._popup_ctrl.Clear()
-        self.assertTrue(self._popup_ctrl.IsListEmpty())
+def test_set_string_selection_item(combobox, popup_ctrl):
+    popup_ctrl.SetStringSelection("item0")
+    assert popup_ctrl.GetStringValue() == "item0"
+    assert combobox.GetValue() == "item0"
 
-    def test_is_text_empty_false(self):
-        self.combobox.SetValue("somevalue")
-        self.assertFalse(self.combobox.GetValue() == "")
 
-    def test_is_text_empty_true(self):
-        self.assertTrue(self.combobox.GetValue() == "")
+def test_set_string_selection_header(combobox, popup_ctrl):
+    popup_ctrl.SetStringSelection("Header")
+    assert combobox.GetStringSelection() == ""
+    assert combobox.GetValue() == ""
 
-    def test_set_selection_item(self):
-        self._popup_ctrl.SetSelection(1)
-        self.assertEqual(self._popup_ctrl.GetSelection(), 1)
-        self.assertEqual(self.combobox.GetValue(), "item0")
 
-    def test_set_selection_header(self):
-        self._popup_ctrl.SetSelection(0)
-        self.assertEqual(self._popup_ctrl.GetSelection(), wx.NOT_FOUND)
-        self.assertEqual(self.combobox.GetValue(), "")
+def test_set_string_selection_invalid_string(combobox, popup_ctrl):
+    popup_ctrl.SetStringSelection("abcde")
+    assert combobox.GetStringSelection() == ""
+    assert combobox.GetValue() == ""
 
-    def test_set_string_selection_item(self):
-        self._popup_ctrl.SetStringSelection("item0")
-        self.assertEqual(self._popup_ctrl.GetStringValue(), "item0")
-        self.assertEqual(self.combobox.GetValue(), "item0")
 
-    def test_set_string_selection_header(self):
-        self._popup_ctrl.SetStringSelection("Header")
-        self.assertEqual(self.combobox.GetStringSelection(), "")
-        self.assertEqual(self.combobox.GetValue(), "")
+# wx.ItemContainer methods
 
-    def test_set_string_selection_invalid_string(self):
-        self._popup_ctrl.SetStringSelection("abcde")
-        self.assertEqual(self.combobox.GetStringSelection(), "")
-        self.assertEqual(self.combobox.GetValue(), "")
 
-    # wx.ItemContainer methods
+def test_clear(combobox, popup_ctrl):
+    combobox.SetValue("value")
+    popup_ctrl.Clear()
+    assert popup_ctrl.GetControl().GetCount() == 0
+    assert combobox.GetValue() == ""
 
-    def test_clear(self):
-        self.combobox.SetValue("value")
-        self._popup_ctrl.Clear()
-        self.assertEqual(self._popup_ctrl.GetControl().GetCount(), 0)
-        self.assertEqual(self.combobox.GetValue(), "")
 
-    def test_append(self):
-        self._popup_ctrl.GetControl().Append("item10")
-        self.assertEqual(self._popup_ctrl.GetControl().GetCount(), 12)
+def test_append(popup_ctrl):
+    popup_ctrl.GetControl().Append("item10")
+    assert popup_ctrl.GetControl().GetCount() == 12
 
-    def test_append_items(self):
-        self._popup_ctrl.GetControl().AppendItems(["item10", "item11"])
-        self.assertEqual(self._popup_ctrl.GetControl().GetCount(), 13)
 
-    def test_delete(self):
-        self._popup_ctrl.GetControl().Delete(1)
-        self.assertEqual(self._popup_ctrl.GetControl().GetString(1), "item1")
+def test_append_items(popup_ctrl):
+    popup_ctrl.GetControl().AppendItems(["item10", "item11"])
+    assert popup_ctrl.GetControl().GetCount() == 13
 
-    # wx.TextEntry methods
 
-    def test_get_value(self):
-        self.combobox.SetValue("value")
-        self.assertEqual(self.combobox.GetValue(), "value")
+def test_delete(popup_ctrl):
+    popup_ctrl.GetControl().Delete(1)
+    assert popup_ctrl.GetControl().GetString(1) == "item1"
 
 
-def main():
-    unittest.main()
+# wx.TextEntry methods
 
 
-if __name__ == "__main__":
-    main()
+def test_get_value(combobox):
+    combobox.SetValue("value")
+    assert combobox.GetValue() == "value"
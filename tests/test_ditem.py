@@ -1,12 +1,8 @@
 """Contains test cases for the DownloadItem object."""
 
-import sys
 import unittest
 from pathlib import Path
 
-PATH = Path(__file__).parent
-sys.path.insert(0, str(PATH.parent))
-
 from youtube_dl_gui.downloadmanager import DownloadItem
 
 HOME = Path("/home/user")
@@ -24,7 +20,7 @@ class TestItemInit(unittest.TestCase):
         self.assertEqual(ditem.stage, "Queued")
         self.assertEqual(ditem.url, url)
         self.assertEqual(ditem.options, options)
-        self.assertEqual(ditem.object_id, hash(url + str(options)))
+        self.assertEqual(ditem.object_id, hash((url, *options)))
 
         self.assertEqual(ditem.path, "")
         self.assertEqual(ditem.filenames, [])
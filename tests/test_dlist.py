@@ -1,14 +1,9 @@
 """Contains test cases for the DownloadList object."""
 
-import os.path
-import sys
 import unittest
 from unittest import mock
 
-PATH = os.path.realpath(os.path.abspath(__file__))
-sys.path.insert(0, os.path.dirname(os.path.dirname(PATH)))
-
-from youtube_dl_gui.downloadmanager import DownloadList, synchronized
+from youtube_dl_gui.downloadmanager import DownloadList
 
 
 class TestInit(unittest.TestCase):
@@ -207,6 +202,16 @@ class TestGetItems(unittest.TestCase):
         dlist = DownloadList()
         self.assertEqual(dlist.get_items(), [])
 
+    def test_get_items_after_remove_and_move(self):
+        mocks = [mock.Mock(object_id=i, stage="Queued") for i in range(3)]
+        dlist = DownloadList(mocks)  # type: ignore
+
+        dlist.remove(0)
+        dlist.move_up(2)
+        dlist.insert(mocks[0])
+
+        self.assertEqual(dlist.get_items(), [mocks[2], mocks[1], mocks[0]])
+
 
 class TestClear(unittest.TestCase):
 
@@ -250,19 +255,15 @@ class TestIndex(unittest.TestCase):
     def test_index_not_exist(self):
         self.assertEqual(self.dlist.index(3), -1)
 
+    def test_index_after_remove_and_move(self):
+        self.dlist.remove(0)
+        self.assertEqual(self.dlist.index(1), 0)
+        self.assertEqual(self.dlist.index(2), 1)
 
-class TestSynchronizeDecorator(unittest.TestCase):
-    def test_synchronize(self):
-        mock_func = mock.Mock()
-        mock_lock = mock.Mock()
-
-        decorated_func = synchronized(mock_lock)(mock_func)
-
-        self.assertEqual(decorated_func(1, a=2), mock_func.return_value)
-
-        mock_func.assert_called_once_with(1, a=2)
-        mock_lock.acquire.assert_called_once()
-        mock_lock.release.assert_called_once()
+        self.dlist.move_up(2)
+        self.assertEqual(self.dlist.index(2), 0)
+        self.assertEqual(self.dlist.index(1), 1)
+        self.assertEqual(self.dlist.index(0), -1)
 
 
 def main():
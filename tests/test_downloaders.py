@@ -1,14 +1,12 @@
 """Contains test cases for the downloaders.py module."""
 
-import sys
 import unittest
 from pathlib import Path
 
-PATH = Path(__file__).parent
-sys.path.insert(0, str(PATH.parent))
-
 from youtube_dl_gui import downloaders
 
+PATH = Path(__file__).parent
+
 YOUTUBEDL_OUTPUT_VIDEO = PATH.joinpath(
     "fixtures/extract_data_video_output.txt"
 ).read_text(encoding="utf-8")
@@ -797,6 +795,21 @@ class TestDownloaders(unittest.TestCase):
     def test_extract_data_playlist(self):
         self.process_data(YOUTUBEDL_OUTPUT_PLAYLIST, "playlist")
 
+    def test_extract_data_already_downloaded_and_merged(self):
+        data = downloaders.extract_data(
+            "[download] Video.mp4 has already been downloaded and merged"
+        )
+
+        self.assertEqual(data["status"], "Already Downloaded")
+        self.assertEqual(data["percent"], "100%")
+        self.assertEqual(data["filename"], "Video")
+        self.assertEqual(data["extension"], ".mp4")
+
+    def test_extract_data_downloaded_not_merged(self):
+        data = downloaders.extract_data("[download] 3 files downloaded in total")
+
+        self.assertDictEqual(data, {"status": "Downloading"})
+
 
 def main():
     unittest.main()
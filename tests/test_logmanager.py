@@ -1,29 +1,68 @@
 """Contains test cases for the logmanager.py module."""
 
-import sys
-import unittest
-from pathlib import Path
+import io
 from unittest import mock
 
-PATH = Path(__file__).parent
-sys.path.insert(0, str(PATH.parent))
-
 from youtube_dl_gui.logmanager import LogManager
 
 
-class TestLogManager(unittest.TestCase):
-    def setUp(self) -> None:
-        self.config_path: str = str(PATH.joinpath("fixtures"))
+def test_init(config_path):
+    log_mng = LogManager(str(config_path), True)
+    log_mng.close()
+    assert log_mng.log_file == str(config_path / LogManager.LOG_FILENAME)
+
+
+def test_log_written_on_close(tmp_path):
+    log_mng = LogManager(str(tmp_path))
+    log_mng.log("Logging from tests")
+    log_mng.close()
+
+    log_file = tmp_path / LogManager.LOG_FILENAME
+    assert "Logging from tests" in log_file.read_text()
+
+
+def test_log_writes_are_buffered(tmp_path):
+    writes = []
+
+    class CountingFileIO(io.FileIO):
+        def write(self, data):
+            writes.append(len(data))
+            return super().write(data)
+
+    def counting_open(file, mode, buffering, encoding):
+        raw = CountingFileIO(file, mode)
+        return io.TextIOWrapper(io.BufferedWriter(raw, buffering), encoding=encoding)
+
+    with mock.patch("youtube_dl_gui.logmanager.open", counting_open, create=True):
+        log_mng = LogManager(str(tmp_path))
+
+        for index in range(2000):
+            log_mng.log(f"Logging from tests {index}")
+
+        log_mng.close()
+
+    log_file = tmp_path / LogManager.LOG_FILENAME
+    assert len(log_file.read_text().splitlines()) == 2000
+    assert len(writes) < 20
+
+
+@mock.patch.object(LogManager, "MAX_LOGSIZE", 1000)
+def test_log_rollover(tmp_path):
+    log_mng = LogManager(str(tmp_path))
+
+    for index in range(100):
+        log_mng.log(f"Logging from tests {index}")
+
+    log_mng.close()
+
+    log_file = tmp_path / LogManager.LOG_FILENAME
+    assert (tmp_path / f"{LogManager.LOG_FILENAME}.1").exists()
+    assert log_file.stat().st_size < 1000
+    assert "Logging from tests 99" in log_file.read_text()
 
-    def test_init(self):
-        log_mng = LogManager(self.config_path, True)
-        self.assertEqual(
-            log_mng.log_file,
-            str(Path(self.config_path) / Path(LogManager.LOG_FILENAME)),
-        )
 
-    @mock.patch("youtube_dl_gui.logmanager.LogManager", autospec=True)
-    def test_log(self, mock_logmanager):
-        opt_mng = mock_logmanager.return_value
-        opt_mng.log(data="Logging from tests")
-        opt_mng.log.assert_called_once()
+@mock.patch("youtube_dl_gui.logmanager.LogManager", autospec=True)
+def test_log(mock_logmanager):
+    opt_mng = mock_logmanager.return_value
+    opt_mng.log(data="Logging from tests")
+    opt_mng.log.assert_called_once()
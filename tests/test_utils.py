@@ -3,12 +3,8 @@
 import locale
 import sys
 import unittest
-from pathlib import Path
 from unittest import mock
 
-PATH = Path(__file__).parent
-sys.path.insert(0, str(PATH.parent))
-
 from youtube_dl_gui import utils
 
 
@@ -38,6 +34,9 @@ class TestUtils(unittest.TestCase):
     @mock.patch("youtube_dl_gui.utils.locale_getpreferredencoding")
     def test_get_encoding(self, mock_getpreferredencoding):
         mock_getpreferredencoding.return_value = "cp65001"
+        # get_encoding is cached, compute it again with the mock in place
+        utils.get_encoding.cache_clear()
+        self.addCleanup(utils.get_encoding.cache_clear)
         encoding = utils.get_encoding()
         self.assertEqual(encoding, "cp65001")
         mock_getpreferredencoding.assert_called_once()
@@ -45,6 +44,9 @@ class TestUtils(unittest.TestCase):
     @mock.patch("youtube_dl_gui.utils.locale_getpreferredencoding")
     def test_get_encoding_error(self, mock_getpreferredencoding):
         mock_getpreferredencoding.side_effect = locale.Error()
+        # get_encoding is cached, compute it again with the mock in place
+        utils.get_encoding.cache_clear()
+        self.addCleanup(utils.get_encoding.cache_clear)
         encoding = utils.get_encoding()
         self.assertEqual(encoding, "utf-8")
         mock_getpreferredencoding.assert_called_once()
@@ -9,27 +9,32 @@ class WidgetTestCase(unittest.TestCase):
     modules to use. They can inherit from this class to save some work. This
     is also good for test cases that just need to have an application object
     created.
+
+    The application object is shared by all the tests of the class, only the
+    frame is created again for every test.
     """
 
-    def setUp(self):
-        self.app = wx.App()
+    @classmethod
+    def setUpClass(cls):
+        cls.app = wx.App()
         wx.Log.SetActiveTarget(wx.LogStderr())
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.app
+
+    def setUp(self):
         self.frame = wx.Frame(None, title=f"WTC: {self.__class__.__name__}")
         # self.frame.Show()
         # self.frame.PostSizeEvent()
 
     def tearDown(self):
-        def _cleanup():
-            for tlw in wx.GetTopLevelWindows():  # type: ignore
-                if tlw:
-                    if isinstance(tlw, wx.Dialog) and tlw.IsModal():
-                        tlw.EndModal(0)
-                        wx.CallAfter(tlw.Destroy)
-                    else:
-                        tlw.Close(force=True)
-            wx.WakeUpIdle()
-
-        timer = wx.PyTimer(_cleanup)
-        timer.Start(100)
-        self.app.MainLoop()
-        del self.app
+        # Destroy the windows synchronously instead of running the main loop
+        for tlw in list(wx.GetTopLevelWindows()):  # type: ignore
+            if not tlw:
+                continue
+            if isinstance(tlw, wx.Dialog) and tlw.IsModal():
+                tlw.EndModal(0)
+            tlw.Destroy()
+
+        wx.SafeYield()
@@ -10,31 +10,43 @@ Example:
 """
 from __future__ import annotations
 
+import contextlib
 import sys
 from pathlib import Path
+from threading import Thread
 from typing import Any, Callable
 
 import wx
 
 from .info import __appname__, __packagename__
 from .logmanager import LogManager
-from .mainframe import MainFrame
 from .optionsmanager import OptionsManager
 from .utils import YOUTUBEDL_BIN, get_config_path, get_locale_file
 from .version import __version__
 
 _: Callable[[str], str] = wx.GetTranslation
 
-# Set config path and create options and log managers
-config_path: str = get_config_path()
-
-opt_manager = OptionsManager(config_path)
-log_manager = None
-
-if opt_manager.options.get("enable_log", True):
-    log_manager = LogManager(config_path, opt_manager.options.get("log_time", True))
-
-locale_dir: str = get_locale_file() or "."
+# Supported Languages
+# Lang code = <ISO 639-1>_<ISO 3166-1 alpha-2>
+_SUP_LANG: dict[str, int] = {
+    "ar_SA": wx.LANGUAGE_ARABIC,
+    "cs_CZ": wx.LANGUAGE_CZECH,
+    "de_DE": wx.LANGUAGE_GERMAN,
+    "en_US": wx.LANGUAGE_ENGLISH_US,
+    "fr_FR": wx.LANGUAGE_FRENCH,
+    "es_CU": wx.LANGUAGE_SPANISH,
+    "it_IT": wx.LANGUAGE_ITALIAN,
+    "ja_JP": wx.LANGUAGE_JAPANESE,
+    "ko_KR": wx.LANGUAGE_KOREAN,
+    "pl_PL": wx.LANGUAGE_POLISH,
+    "pt_BR": wx.LANGUAGE_PORTUGUESE_BRAZILIAN,
+    "ru_RU": wx.LANGUAGE_RUSSIAN,
+    "es_ES": wx.LANGUAGE_SPANISH,
+    "sq_AL": wx.LANGUAGE_ALBANIAN,
+    "sk_SK": wx.LANGUAGE_SLOVAK,
+    "zh_CN": wx.LANGUAGE_CHINESE_SIMPLIFIED,
+    "zh_TW": wx.LANGUAGE_CHINESE_TRADITIONAL,
+}
 
 
 # noinspection PyPep8Naming
@@ -52,9 +64,39 @@ def _displayHook(obj: Any) -> None:
         print(repr(obj))
 
 
+def _preload_catalog(lang: str) -> None:
+    """Read the translation catalog of the given language ahead of wx.
+
+    The file is only read to have it in the OS page cache by the time
+    wx.Locale.AddCatalog loads it.
+
+    Args:
+         lang (str): one of the supported language codes
+
+    """
+    locale_dir = get_locale_file()
+
+    if locale_dir is None:
+        return
+
+    with contextlib.suppress(OSError):
+        (Path(locale_dir) / lang / "LC_MESSAGES" / f"{__packagename__}.mo").read_bytes()
+
+
 # noinspection PyPep8Naming,PyAttributeOutsideInit
 class BaseApp(wx.App):
-    """Base wx Application"""
+    """Base wx Application
+
+    Args:
+        opt_manager (optionsmanager.OptionsManager): Object responsible for
+            managing the yt-dlg options.
+
+    """
+
+    def __init__(self, opt_manager: OptionsManager, *args, **kwargs) -> None:
+        # wx.App.__init__ calls OnInit, the options must be set before
+        self.opt_manager = opt_manager
+        super().__init__(*args, **kwargs)
 
     def OnInit(self) -> bool:
         super().OnInit()
@@ -62,8 +104,8 @@ class BaseApp(wx.App):
 
         self.appName: str = __appname__
         self.locale: wx.Locale | None = None
-        wx.Locale.AddCatalogLookupPathPrefix(locale_dir)
-        self.updateLanguage(opt_manager.options.get("locale_name", "en_US"))
+        wx.Locale.AddCatalogLookupPathPrefix(get_locale_file() or ".")
+        self.updateLanguage(self.opt_manager.options.get("locale_name", "en_US"))
 
         return True
 
@@ -82,29 +124,7 @@ class BaseApp(wx.App):
 
         """
 
-        # Supported Languages
-        # Lang code = <ISO 639-1>_<ISO 3166-1 alpha-2>
-        supLang: dict[str, int] = {
-            "ar_SA": wx.LANGUAGE_ARABIC,
-            "cs_CZ": wx.LANGUAGE_CZECH,
-            "de_DE": wx.LANGUAGE_GERMAN,
-            "en_US": wx.LANGUAGE_ENGLISH_US,
-            "fr_FR": wx.LANGUAGE_FRENCH,
-            "es_CU": wx.LANGUAGE_SPANISH,
-            "it_IT": wx.LANGUAGE_ITALIAN,
-            "ja_JP": wx.LANGUAGE_JAPANESE,
-            "ko_KR": wx.LANGUAGE_KOREAN,
-            "pl_PL": wx.LANGUAGE_POLISH,
-            "pt_BR": wx.LANGUAGE_PORTUGUESE_BRAZILIAN,
-            "ru_RU": wx.LANGUAGE_RUSSIAN,
-            "es_ES": wx.LANGUAGE_SPANISH,
-            "sq_AL": wx.LANGUAGE_ALBANIAN,
-            "sk_SK": wx.LANGUAGE_SLOVAK,
-            "zh_CN": wx.LANGUAGE_CHINESE_SIMPLIFIED,
-            "zh_TW": wx.LANGUAGE_CHINESE_TRADITIONAL,
-        }
-
-        selLang: int = supLang.get(lang, wx.LANGUAGE_ENGLISH)
+        selLang: int = _SUP_LANG.get(lang, wx.LANGUAGE_ENGLISH)
 
         if self.locale:
             assert sys.getrefcount(self.locale) <= 2
@@ -119,11 +139,6 @@ class BaseApp(wx.App):
             self.locale = None
 
 
-# BaseApp and MainFrame
-app = BaseApp(redirect=False)
-frame = MainFrame(opt_manager, log_manager)
-
-
 def main() -> int:
     """
     The real main. Calls the main app (`BaseApp`) windows.
@@ -136,10 +151,32 @@ def main() -> int:
         print(f"{__appname__} {__version__}")
         return _error
 
+    # Set config path and create options and log managers
+    config_path: str = get_config_path()
+
+    opt_manager = OptionsManager(config_path)
+    log_manager = None
+
+    # Warm up the translation catalog while the GUI modules are loaded
+    Thread(
+        target=_preload_catalog,
+        args=(opt_manager.options.get("locale_name", "en_US"),),
+        daemon=True,
+    ).start()
+
+    # Deferred, the GUI modules are only needed once the app is started
+    from .mainframe import MainFrame
+
+    if opt_manager.options.get("enable_log", True):
+        log_manager = LogManager(config_path, opt_manager.options.get("log_time", True))
+
     youtubedl_path: Path = (
         Path(opt_manager.options.get("youtubedl_path", ".")) / YOUTUBEDL_BIN
     )
 
+    # BaseApp and MainFrame
+    app = BaseApp(opt_manager, redirect=False)
+    frame = MainFrame(opt_manager, log_manager)
     frame.Show()
 
     if opt_manager.options.get("disable_update", False) and not youtubedl_path.exists():
@@ -9,16 +9,16 @@ DARK_LIGHTGREY_COLOUR = wx.Colour(240, 240, 240, 255)
 
 
 def get_widgets(parent: wx.Window | wx.Panel) -> list[wx.Window]:
-    """Return a list of all the child widgets"""
+    """Return the parent and all its descendant widgets (depth first)"""
 
-    items: list[wx.Window] = [parent]
+    items: list[wx.Window] = []
+    stack: list[wx.Window] = [parent]
 
-    for item in parent.GetChildren():
+    # wx windows form a tree, no need to track the visited ones
+    while stack:
+        item = stack.pop()
         items.append(item)
-
-        if hasattr(item, "GetChildren"):
-            for child in item.GetChildren():
-                items.append(child)
+        stack.extend(reversed(item.GetChildren()))
 
     return items
 
@@ -26,32 +26,52 @@ def get_widgets(parent: wx.Window | wx.Panel) -> list[wx.Window]:
 def dark_row_formatter(listctrl: wx.ListCtrl, dark: bool = False) -> None:
     """Toggles the row in a ListCtrl"""
 
-    items = [listctrl.GetItem(i) for i in range(listctrl.GetItemCount())]
+    if not dark:
+        return
 
-    for index, item in enumerate(items):
-        if dark:
-            if index % 2:
-                item.SetBackgroundColor(DARK_BACKGROUND_COLOUR)
-            else:
-                item.SetBackgroundColor(DARK_LIGHTGREY_COLOUR)
+    listctrl.Freeze()
 
-        listctrl.SetItem(item)
+    try:
+        for index in range(listctrl.GetItemCount()):
+            listctrl.SetItemBackgroundColour(
+                index, DARK_BACKGROUND_COLOUR if index & 1 else DARK_LIGHTGREY_COLOUR
+            )
+    finally:
+        listctrl.Thaw()
 
 
 def dark_mode(parent: wx.Window | wx.Panel, _dark_mode: bool = False) -> None:
     """Toggles dark mode"""
 
+    if not _dark_mode:
+        parent.Refresh()
+        return
+
     widgets: list[wx.Window] = get_widgets(parent)
     # panel = widgets[0]
 
-    for widget in widgets:
-        if _dark_mode and not isinstance(widget, (wx.TextCtrl, wx.StaticLine)):
-            widget.SetBackgroundColour(DARK_BACKGROUND_COLOUR)
-            widget.SetForegroundColour(DARK_FOREGROUND_COLOUR)
+    # Batch the colour changes into a single repaint
+    parent.Freeze()
+
+    try:
+        for widget in widgets:
+            if isinstance(widget, (wx.TextCtrl, wx.StaticLine)):
+                continue
+
+            if isinstance(widget, wx.Button):
+                background = DARK_BACKGROUND_COLOUR_BUTTON
+            else:
+                background = DARK_BACKGROUND_COLOUR
+
+            # Setting a colour restyles the widget even when it is unchanged
+            if widget.GetBackgroundColour() != background:
+                widget.SetBackgroundColour(background)
+            if widget.GetForegroundColour() != DARK_FOREGROUND_COLOUR:
+                widget.SetForegroundColour(DARK_FOREGROUND_COLOUR)
 
             if isinstance(widget, wx.ListCtrl):
                 dark_row_formatter(widget, dark=True)
-            elif isinstance(widget, wx.Button):
-                widget.SetBackgroundColour(DARK_BACKGROUND_COLOUR_BUTTON)
+    finally:
+        parent.Thaw()
 
     parent.Refresh()
@@ -12,24 +12,23 @@ import os
 import re
 import signal
 import subprocess
-from pathlib import Path
 from queue import Queue
-from threading import Thread
-from time import sleep
-from typing import IO, Any, Callable
+from threading import Event, Thread
+from typing import IO, Any, Callable, ClassVar
 
 from .utils import IS_WINDOWS, get_encoding
 
+# stderr prefixes that set the WARNING return code
+_WARN_OR_ERROR = frozenset({"WARNING", "ERROR"})
+
 
 # noinspection PyUnresolvedReferences
 class PipeReader(Thread):
     """Helper class to avoid deadlocks when reading from subprocess pipes.
 
     This class uses python threads and queues in order to read from subprocess
-    pipes in an asynchronous way.
-
-    Attributes:
-        WAIT_TIME (float): Time in seconds to sleep.
+    pipes in an asynchronous way. The thread blocks on the attached pipe until
+    a new line is available, and waits for the next pipe once it reaches EOF.
 
     Args:
         queue (Queue): Python queue to store the output of the subprocess.
@@ -39,40 +38,47 @@ class PipeReader(Thread):
 
     """
 
-    WAIT_TIME = 0.1
-
     def __init__(self, queue: Queue):
         super().__init__()
         self._filedescriptor: IO[str] | None = None
         self._running: bool = True
         self._queue: Queue[str] = queue
+        self._attached = Event()
         self.start()
 
     def run(self) -> None:
-        # Flag to ignore specific lines
-        ignore_line: bool = False
-
         while self._running:
-            if self._filedescriptor is not None and not self._filedescriptor.closed:
-                pipedata: str = self._filedescriptor.read()
+            # Sleep until a new pipe is attached or join() is called
+            self._attached.wait()
+            self._attached.clear()
+
+            filedesc = self._filedescriptor
+
+            if filedesc is None:
+                continue
+
+            # Flag to ignore specific lines
+            ignore_line: bool = False
+
+            # The pipe can be closed under our feet by YoutubeDLDownloader.stop()
+            with contextlib.suppress(ValueError, OSError):
+                for line in iter(filedesc.readline, ""):
+                    line = line.rstrip()
 
-                for line in pipedata.splitlines():
                     # Ignore ffmpeg stderr
                     if "ffmpeg version" in line:
                         ignore_line = True
                     if not ignore_line and line:
                         self._queue.put_nowait(line)
 
-                ignore_line = False
-
-            sleep(self.WAIT_TIME)
-
     def attach_filedescriptor(self, filedesc: IO[str] | None = None) -> None:
         """Attach a filedescriptor to the PipeReader."""
         self._filedescriptor = filedesc
+        self._attached.set()
 
     def join(self, timeout=None) -> None:
         self._running = False
+        self._attached.set()
         super().join(timeout)
 
 
@@ -121,6 +127,15 @@ class YoutubeDLDownloader:
     ALREADY = 4
     STOPPED = 5
 
+    _STATUS_LABELS: ClassVar[dict[int, str]] = {
+        OK: "Finished",
+        WARNING: "Warning",
+        ERROR: "Error",
+        FILESIZE_ABORT: "Filesize Abort",
+        ALREADY: "Already Downloaded",
+        STOPPED: "Stopped",
+    }
+
     def __init__(
         self,
         youtubedl_path: str,
@@ -165,21 +180,26 @@ class YoutubeDLDownloader:
         if self._proc is not None:
             self._stderr_reader.attach_filedescriptor(self._proc.stderr)
 
-        while self._proc_is_alive():
-            stdout: str = ""
-            if not self._proc.stdout.closed:
-                with contextlib.suppress(ValueError):
-                    stdout = self._proc.stdout.readline().rstrip()
-            if stdout:
-                data_dict = extract_data(stdout)
-                self._extract_info(data_dict)
-                self._hook_data(data_dict)
+            # Iterate until EOF, stop() closes stdout to break out early
+            with contextlib.suppress(ValueError):
+                for line in self._proc.stdout:
+                    stdout: str = line.rstrip()
+
+                    if stdout:
+                        data_dict = extract_data(stdout)
+                        self._extract_info(data_dict)
+                        self._hook_data(data_dict)
+
+            # stdout reached EOF, collect the exit status
+            self._proc.wait()
 
         # Read stderr after download process has been completed
-        # We don't need to read stderr in real time
-        while not self._stderr_queue.empty():
-            stderr = str(self._stderr_queue.get_nowait()).rstrip()
+        # We don't need to read stderr in real time, take it all in one go
+        with self._stderr_queue.mutex:
+            stderr_lines = list(self._stderr_queue.queue)
+            self._stderr_queue.queue.clear()
 
+        for stderr in stderr_lines:
             self._log(stderr)
 
             if self._is_warning(stderr):
@@ -199,8 +219,8 @@ class YoutubeDLDownloader:
         if not self._proc_is_alive():
             return
 
-        self._proc.stdout.close()
-        self._proc.stderr.close()
+        # Set before killing, download() returns as soon as the pipes hit EOF
+        self._set_returncode(self.STOPPED)
 
         with contextlib.suppress(ProcessLookupError):
             if IS_WINDOWS:
@@ -216,7 +236,11 @@ class YoutubeDLDownloader:
             else:
                 # TODO: Test in Unix os.killpg ?
                 os.killpg(self._proc.pid, signal.SIGKILL)  # type: ignore
-        self._set_returncode(self.STOPPED)
+
+        # Close the pipes only once the process is gone, closing a pipe that
+        # download() is blocked reading would wait for the child to write
+        self._proc.stdout.close()
+        self._proc.stderr.close()
 
     def close(self) -> None:
         """Destructor like function for the object."""
@@ -230,31 +254,16 @@ class YoutubeDLDownloader:
 
     @staticmethod
     def _is_warning(stderr: str) -> bool:
-        warning_error = stderr.split(":")[0]
-        warning_error = warning_error.strip()
-        return warning_error in ["WARNING", "ERROR"]
+        return stderr.partition(":")[0].strip() in _WARN_OR_ERROR
 
     def _last_data_hook(self) -> None:
         """Set the last data information based on the return code."""
         data_dictionary: dict[str, str] = {
-            "status": "",
+            "status": self._STATUS_LABELS.get(self._return_code, "Filesize Abort"),
             "speed": "",
             "eta": "",
         }
 
-        if self._return_code == self.OK:
-            data_dictionary["status"] = "Finished"
-        elif self._return_code == self.ERROR:
-            data_dictionary["status"] = "Error"
-        elif self._return_code == self.WARNING:
-            data_dictionary["status"] = "Warning"
-        elif self._return_code == self.STOPPED:
-            data_dictionary["status"] = "Stopped"
-        elif self._return_code == self.ALREADY:
-            data_dictionary["status"] = "Already Downloaded"
-        else:
-            data_dictionary["status"] = "Filesize Abort"
-
         self._hook_data(data_dictionary)
 
     def _extract_info(self, data: dict[str, Any]) -> None:
@@ -357,12 +366,127 @@ def extract_filename(input_data: str) -> tuple[str, str, str]:
         Python tuple with path, filename and extension
 
     """
-    _filename = Path(input_data.strip('"'))
-    path: str = str(_filename.parent) if str(_filename.parent) != "." else ""
-    filename: str = _filename.stem
-    extension: str = _filename.suffix
+    # os.path works on the string, no need to build a Path for every line
+    path, basename = os.path.split(input_data.strip('"'))
+    filename, extension = os.path.splitext(basename)
+
+    # Match pathlib, a trailing dot is part of the name
+    if extension == ".":
+        filename, extension = basename, ""
+
+    return (path if path != "." else ""), filename, extension
+
+
+def _set_filename(data_dictionary: dict[str, str], input_data: str) -> None:
+    """Store the path, filename & extension of input_data in data_dictionary."""
+    path, filename, extension = extract_filename(input_data.strip())
+
+    data_dictionary["path"] = path
+    data_dictionary["filename"] = filename
+    data_dictionary["extension"] = extension
+
+
+def _extract_download(
+    stdout: str, stdout_list: list[str], data_dictionary: dict[str, str]
+) -> None:
+    """Extract data from the '[download]' lines."""
+    data_dictionary["status"] = "Downloading"
+
+    verb = stdout_list[1]
+
+    # Get progress info
+    if verb[-1] == "%":
+        data_dictionary["percent"] = verb
+        data_dictionary["filesize"] = stdout_list[3]
+
+        if verb == "100%":
+            data_dictionary["speed"] = ""
+            data_dictionary["eta"] = ""
+        else:
+            data_dictionary["speed"] = stdout_list[5]
+            data_dictionary["eta"] = stdout_list[7]
 
-    return path, filename, extension
+    # Get path, filename & extension
+    elif verb == "Destination:":
+        _set_filename(data_dictionary, stdout.partition("Destination:")[2])
+
+    # Get playlist info
+    elif verb == "Downloading" and stdout_list[2] == "video":
+        data_dictionary["playlist_index"] = stdout_list[3]
+        data_dictionary["playlist_size"] = stdout_list[5]
+
+    # The 'and merged' part is present when using ffmpeg to merge the formats
+    merged = stdout_list[-3] == "downloaded" and stdout_list[-1] == "merged"
+
+    if merged:
+        data_dictionary["percent"] = "100%"
+
+    # Get file already downloaded status
+    if stdout_list[-1] == "downloaded" or merged:
+        data_dictionary["status"] = "Already Downloaded"
+        filename = stdout.partition(" ")[2].rpartition(" has already been")[0]
+        _set_filename(data_dictionary, filename)
+
+    # Get filesize abort status
+    elif stdout_list[-1] == "Aborting.":
+        data_dictionary["status"] = "Filesize Abort"
+
+
+def _extract_hlsnative(
+    stdout: str, stdout_list: list[str], data_dictionary: dict[str, str]
+) -> None:
+    """Extract data from the '[hlsnative]' lines."""
+    # native hls extractor
+    # see: https://github.com/rg3/youtube-dl/blob/master/youtube_dl/downloader/hls.py#L54
+    data_dictionary["status"] = "Downloading"
+
+    if len(stdout_list) == 7:
+        segment_no = float(stdout_list[6])
+        current_segment = float(stdout_list[4])
+
+        # Get the percentage
+        percent = f"{current_segment / segment_no * 100:.1f}%"
+        data_dictionary["percent"] = percent
+
+
+# Text preceding the output filename for each ffmpeg action:
+# Merging: final extension after merging process
+# Destination: final extension ffmpeg post process simple (not file merge)
+# Converting: final extension after recoding process
+_FFMPEG_FILENAME_PREFIX: dict[str, str] = {
+    "Merging": "Merging formats into",
+    "Destination:": "Destination:",
+    "Converting": "Destination:",
+}
+
+
+def _extract_ffmpeg(
+    stdout: str, stdout_list: list[str], data_dictionary: dict[str, str]
+) -> None:
+    """Extract data from the '[ffmpeg]' lines."""
+    data_dictionary["status"] = "Post Processing"
+
+    prefix = _FFMPEG_FILENAME_PREFIX.get(stdout_list[1])
+
+    if prefix is not None:
+        _set_filename(data_dictionary, stdout.partition(prefix)[2])
+
+
+_EXTRACTORS: dict[str, Callable[[str, list[str], dict[str, str]], None]] = {
+    "[download]": _extract_download,
+    "[hlsnative]": _extract_hlsnative,
+    "[ffmpeg]": _extract_ffmpeg,
+}
+
+
+# '[download]  42.0% of ~1.23MiB at 456.00KiB/s ETA 00:10', the fields are
+# matched by position because 'at Unknown speed ETA Unknown ETA' is valid too
+_PROGRESS_RE = re.compile(
+    r"\[download\]\s+(\d+(?:\.\d+)?%)\s+of\s+(~?)\s*(\S+)\s+\S+\s+(\S+)\s+\S+\s+(\S+)"
+)
+
+# Fix output of yt-dlp compatible with youtube-dl
+_APPROX_SIZE_RE = re.compile(r"~\s+")
 
 
 def extract_data(stdout: str) -> dict[str, str]:
@@ -393,104 +517,40 @@ def extract_data(stdout: str) -> dict[str, str]:
 
     data_dictionary: dict[str, str] = {}
 
-    if not stdout:
+    # Skip the leading '\r' of the progress lines
+    stdout = stdout.lstrip()
+
+    # Only the '[...]' prefixed lines carry data, the rest ends here
+    if not stdout.startswith("["):
         return data_dictionary
 
-    # We want to keep the spaces in order to extract filenames with
-    # multiple whitespaces correctly.
-    # Fix output of yt-dlp compatible with youtube-dl
-    stdout_list: list[str] = re.sub(r"~\s+", "~", stdout, count=1).split()
+    # Progress lines are the bulk of the output, match them in one go
+    match = _PROGRESS_RE.match(stdout)
 
-    stdout_list[0] = stdout_list[0].lstrip("\r")
+    if match is not None:
+        percent, approx, filesize, speed, eta = match.groups()
 
-    if stdout_list[0] == "[download]":
-        data_dictionary["status"] = "Downloading"
+        if percent == "100%":
+            speed = eta = ""
 
-        # Get path, filename & extension
-        if stdout_list[1] == "Destination:":
-            path, filename, extension = extract_filename(" ".join(stdout_list[2:]))
-
-            data_dictionary["path"] = path
-            data_dictionary["filename"] = filename
-            data_dictionary["extension"] = extension
-
-        # Get progress info
-        if "%" in stdout_list[1]:
-            if stdout_list[1] == "100%":
-                data_dictionary["speed"] = ""
-                data_dictionary["eta"] = ""
-                data_dictionary["percent"] = "100%"
-                data_dictionary["filesize"] = stdout_list[3]
-            else:
-                data_dictionary["percent"] = stdout_list[1]
-                data_dictionary["filesize"] = stdout_list[3]
-                data_dictionary["speed"] = stdout_list[5]
-                data_dictionary["eta"] = stdout_list[7]
-
-        # Get playlist info
-        if stdout_list[1] == "Downloading" and stdout_list[2] == "video":
-            data_dictionary["playlist_index"] = stdout_list[3]
-            data_dictionary["playlist_size"] = stdout_list[5]
-
-        # Remove the 'and merged' part from stdout when using ffmpeg to merge the formats
-        if stdout_list[-3] == "downloaded" and stdout_list[-1] == "merged":
-            stdout_list = stdout_list[:-2]
-            data_dictionary["percent"] = "100%"
-
-        # Get file already downloaded status
-        if stdout_list[-1] == "downloaded":
-            data_dictionary["status"] = "Already Downloaded"
-            path, filename, extension = extract_filename(" ".join(stdout_list[1:-4]))
-
-            data_dictionary["path"] = path
-            data_dictionary["filename"] = filename
-            data_dictionary["extension"] = extension
-
-        # Get filesize abort status
-        if stdout_list[-1] == "Aborting.":
-            data_dictionary["status"] = "Filesize Abort"
-
-    elif stdout_list[0] == "[hlsnative]":
-        # native hls extractor
-        # see: https://github.com/rg3/youtube-dl/blob/master/youtube_dl/downloader/hls.py#L54
         data_dictionary["status"] = "Downloading"
+        data_dictionary["percent"] = percent
+        data_dictionary["filesize"] = approx + filesize
+        data_dictionary["speed"] = speed
+        data_dictionary["eta"] = eta
 
-        if len(stdout_list) == 7:
-            segment_no = float(stdout_list[6])
-            current_segment = float(stdout_list[4])
-
-            # Get the percentage
-            percent = f"{current_segment / segment_no * 100:.1f}%"
-            data_dictionary["percent"] = percent
-
-    elif stdout_list[0] == "[ffmpeg]":
-        data_dictionary["status"] = "Post Processing"
-
-        # Get final extension after merging process
-        if stdout_list[1] == "Merging":
-            path, filename, extension = extract_filename(" ".join(stdout_list[4:]))
-
-            data_dictionary["path"] = path
-            data_dictionary["filename"] = filename
-            data_dictionary["extension"] = extension
-
-        # Get final extension ffmpeg post process simple (not file merge)
-        if stdout_list[1] == "Destination:":
-            path, filename, extension = extract_filename(" ".join(stdout_list[2:]))
-
-            data_dictionary["path"] = path
-            data_dictionary["filename"] = filename
-            data_dictionary["extension"] = extension
+        return data_dictionary
 
-        # Get final extension after recoding process
-        if stdout_list[1] == "Converting":
-            path, filename, extension = extract_filename(" ".join(stdout_list[8:]))
+    # We want to keep the spaces in order to extract filenames with
+    # multiple whitespaces correctly.
+    stdout_list: list[str] = _APPROX_SIZE_RE.sub("~", stdout, count=1).split()
 
-            data_dictionary["path"] = path
-            data_dictionary["filename"] = filename
-            data_dictionary["extension"] = extension
+    head = stdout_list[0]
+    extractor = _EXTRACTORS.get(head)
 
-    elif stdout_list[0][0] == "[" and stdout_list[0] != "[debug]":
+    if extractor is not None:
+        extractor(stdout, stdout_list, data_dictionary)
+    elif head != "[debug]":
         data_dictionary["status"] = "Pre Processing"
 
     return data_dictionary
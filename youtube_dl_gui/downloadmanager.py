@@ -17,9 +17,13 @@ Note:
 """
 from __future__ import annotations
 
+import itertools
+import os
 import time
+from collections import deque
 from pathlib import Path
-from threading import RLock, Thread
+from queue import Queue
+from threading import Event, Lock, Thread
 from typing import TYPE_CHECKING, Any, Callable
 
 import wx
@@ -40,22 +44,7 @@ if TYPE_CHECKING:
 MANAGER_PUB_TOPIC = "dlmanager"
 WORKER_PUB_TOPIC = "dlworker"
 
-_SYNC_LOCK = RLock()
-
-
-def synchronized(lock: RLock) -> Callable[..., Any]:
-    """Decorator that adds thread synchronization to a function"""
-
-    def _decorator(func: Callable) -> Callable[..., Any]:
-        def _wrapper(*args, **kwargs) -> Any:
-            lock.acquire()
-            ret_value: Any = func(*args, **kwargs)
-            lock.release()
-            return ret_value
-
-        return _wrapper
-
-    return _decorator
+_worker_counter = itertools.count(1)
 
 
 class DownloadItem:
@@ -85,10 +74,40 @@ class DownloadItem:
 
     ERROR_STAGES = ("Error", "Stopped", "Filesize Abort")
 
+    # Status shown when the item is moved to each of the main stages
+    _STAGE_TO_STATUS = {
+        "Queued": "Queued",
+        "Active": ACTIVE_STAGES[0],
+        "Paused": "Paused",
+        "Completed": COMPLETED_STAGES[0],
+        "Error": ERROR_STAGES[0],
+    }
+
+    # Main stage that corresponds to each of the sub stages
+    _STATUS_TO_STAGE = {
+        **dict.fromkeys(ACTIVE_STAGES, "Active"),
+        **dict.fromkeys(COMPLETED_STAGES, "Completed"),
+        **dict.fromkeys(ERROR_STAGES, "Error"),
+    }
+
+    # Progress stats shared by all the items, reset() fills in the
+    # 'filename' and 'status' of the item
+    _DEFAULT_TEMPLATE = {
+        "filename": "",
+        "extension": "-",
+        "filesize": "-",
+        "percent": "0%",
+        "speed": "-",
+        "eta": "-",
+        "status": "Queued",
+        "playlist_size": "",
+        "playlist_index": "",
+    }
+
     def __init__(self, url: str, options: list[str]):
         self.url: str = url
         self.options: list[str] = options
-        self.object_id: int = hash(url + str(options))
+        self.object_id: int = hash((url, *options))
         self._stage: str = self.STAGES[0]
         self.path: str = ""
         self.filenames: list[str] = []
@@ -105,18 +124,12 @@ class DownloadItem:
 
     @stage.setter
     def stage(self, value: str) -> None:
-        if value not in self.STAGES:
-            raise ValueError(value)
+        status = self._STAGE_TO_STATUS.get(value)
 
-        if value == "Active":
-            self.progress_stats["status"] = self.ACTIVE_STAGES[0]
-        elif value == "Completed":
-            self.progress_stats["status"] = self.COMPLETED_STAGES[0]
-        elif value == "Error":
-            self.progress_stats["status"] = self.ERROR_STAGES[0]
+        if status is None:
+            raise ValueError(value)
 
-        elif value in {"Queued", "Paused"}:
-            self.progress_stats["status"] = value
+        self.progress_stats["status"] = status
         self._stage = value
 
     def _init_filename_sizes_extensions(self) -> None:
@@ -133,86 +146,81 @@ class DownloadItem:
         self._init_filename_sizes_extensions()
 
         self.default_values: dict[str, str] = {
+            **self._DEFAULT_TEMPLATE,
             "filename": self.url,
-            "extension": "-",
-            "filesize": "-",
-            "percent": "0%",
-            "speed": "-",
-            "eta": "-",
-            "status": self.stage,
-            "playlist_size": "",
-            "playlist_index": "",
+            "status": self._stage,
         }
 
-        self.progress_stats = dict(self.default_values)
+        self.progress_stats = self.default_values.copy()
         # Keep track when the 'playlist_index' changes
         self.playlist_index_changed = False
 
     def get_files(self) -> list[str]:
         """Returns a list that contains all the system files bind to this object."""
         return [
-            str(Path(self.path) / Path(item + self.extensions[index]))
-            for index, item in enumerate(self.filenames)
+            os.path.join(self.path, filename + extension)
+            for filename, extension in zip(self.filenames, self.extensions)
         ]
 
     def update_stats(self, stats_dict: dict[str, Any]) -> None:
         """Updates the progress_stats dict from the given dictionary."""
         assert isinstance(stats_dict, dict)
 
-        for key in stats_dict:
-            if key in self.progress_stats:
-                value = stats_dict.get(key)
+        progress_stats = self.progress_stats
+        default_values = self.default_values
+
+        for key, value in stats_dict.items():
+            if key in progress_stats:
+                progress_stats[key] = value or default_values[key]
 
-                self.progress_stats[key] = value or self.default_values[key]
         # Extract extra stuff
+        filename = stats_dict.get("filename")
+        extension = stats_dict.get("extension")
+        path = stats_dict.get("path")
+        filesize = stats_dict.get("filesize")
+        status = stats_dict.get("status")
+
         if "playlist_index" in stats_dict:
             self.playlist_index_changed = True
 
-        if "filename" in stats_dict:
+        if filename is not None:
             # Reset filenames, extensions & filesizes lists when changing playlist item
             if self.playlist_index_changed:
                 self._init_filename_sizes_extensions()
                 self.playlist_index_changed = False
 
-            self.filenames.append(stats_dict["filename"])
+            self.filenames.append(filename)
 
-        if "extension" in stats_dict:
-            self.extensions.append(stats_dict["extension"])
+        if extension is not None:
+            self.extensions.append(extension)
 
-        if "path" in stats_dict:
-            self.path = stats_dict["path"]
+        if path is not None:
+            self.path = path
 
         if (
-            "filesize" in stats_dict
-            and stats_dict["percent"] == "100%"
+            filesize is not None
+            and stats_dict.get("percent") == "100%"
             and len(self.filesizes) < len(self.filenames)
         ):
-            filesize = stats_dict["filesize"].lstrip("~")  # HLS downloader etc
+            filesize = filesize.lstrip("~")  # HLS downloader etc
             self.filesizes.append(to_bytes(filesize))
 
-        if "status" in stats_dict:
+        if status is not None:
             # If we are post processing try to calculate the size of
             # the output file since youtube-dl does not
-            if (
-                stats_dict["status"] == self.ACTIVE_STAGES[2]
-                and len(self.filesizes) == 2
-            ):
+            if status == self.ACTIVE_STAGES[2] and len(self.filesizes) == 2:
                 post_proc_filesize = self.filesizes[0] + self.filesizes[1]
 
                 self.filesizes.append(post_proc_filesize)
-                self.progress_stats["filesize"] = format_bytes(post_proc_filesize)
+                progress_stats["filesize"] = format_bytes(post_proc_filesize)
 
-            self._set_stage(stats_dict["status"])
+            self._set_stage(status)
 
     def _set_stage(self, status: str) -> None:
-        if status in self.ACTIVE_STAGES:
-            self._stage = self.STAGES[1]
-
-        if status in self.COMPLETED_STAGES:
-            self._stage = self.STAGES[3]
+        stage = self._STATUS_TO_STAGE.get(status)
 
-        if status in self.ERROR_STAGES:
-            self._stage = self.STAGES[4]
+        if stage is not None:
+            self._stage = stage
 
     def __eq__(self, other: object) -> bool:
         return (
@@ -228,6 +236,10 @@ class DownloadItem:
 class DownloadList:
     """List like data structure that contains DownloadItems.
 
+    The mutating methods hold a lock, the readers do not. Single dict and
+    list operations are atomic, so the writers update the dict and the
+    list in an order that never shows a reader an id without its item.
+
     Args:
         items (list): List that contains DownloadItems.
 
@@ -236,26 +248,39 @@ class DownloadList:
     def __init__(self, items: list[DownloadItem] | None = None):
         assert isinstance(items, list) or items is None
 
+        self._lock = Lock()
+        self._changed = Event()
         self._items_dict: dict[int, DownloadItem] = {}  # Speed up lookup
         self._items_list: list[int] = []  # Keep the sequence
+        self._items_ordered: list[DownloadItem] = []  # Same sequence, the items
+        self._index_map: dict[int, int] = {}  # Position of each object_id
 
         if items:
             self._items_list = [item.object_id for item in items]
+            self._items_ordered = list(items)
             self._items_dict = {item.object_id: item for item in items}
+            self._index_map = {
+                object_id: index for index, object_id in enumerate(self._items_list)
+            }
 
-    @synchronized(_SYNC_LOCK)
     def clear(self) -> None:
         """Removes all the items from the list even the 'Active' ones."""
-        self._items_list = []
-        self._items_dict = {}
+        with self._lock:
+            self._items_list = []
+            self._items_ordered = []
+            self._items_dict = {}
+            self._index_map = {}
 
-    @synchronized(_SYNC_LOCK)
     def insert(self, item: DownloadItem) -> None:
         """Inserts the given item to the list. Does not check for duplicates."""
-        self._items_list.append(item.object_id)
-        self._items_dict[item.object_id] = item
+        with self._lock:
+            self._items_dict[item.object_id] = item
+            self._index_map[item.object_id] = len(self._items_list)
+            self._items_list.append(item.object_id)
+            self._items_ordered.append(item)
+
+        self.notify()
 
-    @synchronized(_SYNC_LOCK)
     def remove(self, object_id: int | None) -> bool:
         """Removes an item from the list.
 
@@ -268,16 +293,22 @@ class DownloadList:
         """
         assert object_id is not None
 
-        item = self._items_dict[object_id]
+        with self._lock:
+            item = self._items_dict[object_id]
+
+            if item and item.stage != "Active":
+                index = self._index_map.pop(object_id)
+                del self._items_list[index]
+                del self._items_ordered[index]
+                del self._items_dict[object_id]
 
-        if item and item.stage != "Active":
-            self._items_list.remove(object_id)
-            del self._items_dict[object_id]
+                # Shift the positions of the items that followed
+                for position in range(index, len(self._items_list)):
+                    self._index_map[self._items_list[position]] = position
 
-            return True
-        return False
+                return True
+            return False
 
-    @synchronized(_SYNC_LOCK)
     def fetch_next(self) -> DownloadItem | None:
         """Returns the next queued item on the list.
 
@@ -285,83 +316,101 @@ class DownloadList:
             Next queued item or None if no other item exist.
 
         """
-        for object_id in self._items_list:
-            cur_item = self._items_dict[object_id]
+        # Iterate over a copy, the list can change under our feet
+        for cur_item in self._items_ordered[:]:
             if cur_item.stage == "Queued":
                 return cur_item
 
         return None
 
-    @synchronized(_SYNC_LOCK)
     def move_up(self, object_id: int):
         """Moves the item with the corresponding object_id up to the list."""
-        index: int = self._items_list.index(object_id)
+        with self._lock:
+            index: int = self._position(object_id)
 
-        if index > 0:
-            self._swap(index, index - 1)
-            return True
+            if index > 0:
+                self._swap(index, index - 1)
+                return True
 
-        return False
+            return False
 
-    @synchronized(_SYNC_LOCK)
     def move_down(self, object_id: int):
         """Moves the item with the corresponding object_id down to the list."""
-        index: int = self._items_list.index(object_id)
+        with self._lock:
+            index: int = self._position(object_id)
 
-        if index < (len(self._items_list) - 1):
-            self._swap(index, index + 1)
-            return True
+            if index < (len(self._items_list) - 1):
+                self._swap(index, index + 1)
+                return True
 
-        return False
+            return False
 
-    @synchronized(_SYNC_LOCK)
     def get_item(self, object_id: int | None) -> DownloadItem | None:
         """Returns the DownloadItem with the given object_id."""
         assert object_id is not None
         return self._items_dict.get(object_id, None)
 
-    @synchronized(_SYNC_LOCK)
     def has_item(self, object_id: int) -> bool:
         """Returns True if the given object_id is in the list else False."""
-        return object_id in self._items_list
+        return object_id in self._items_dict
 
-    @synchronized(_SYNC_LOCK)
     def get_items(self) -> list[DownloadItem]:
         """Returns a list with all the items."""
-        return [self._items_dict[object_id] for object_id in self._items_list]
+        return self._items_ordered[:]
 
-    @synchronized(_SYNC_LOCK)
     def change_stage(self, object_id: int, new_stage: str) -> None:
         """Change the stage of the item with the given object_id."""
-        self._items_dict[object_id].stage = new_stage
+        with self._lock:
+            self._items_dict[object_id].stage = new_stage
+
+        self.notify()
+
+    def notify(self) -> None:
+        """Wake up the threads waiting in wait()."""
+        self._changed.set()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until an item is inserted or changes stage, notify() is
+        called or the timeout expires."""
+        self._changed.wait(timeout)
+        self._changed.clear()
 
-    @synchronized(_SYNC_LOCK)
     def index(self, object_id: int) -> int:
         """Get the zero based index of the item with the given object_id."""
-        if object_id in self._items_list:
-            return self._items_list.index(object_id)
-        return -1
+        return self._index_map.get(object_id, -1)
 
-    @synchronized(_SYNC_LOCK)
     def __len__(self) -> int:
         return len(self._items_list)
 
-    @synchronized(_SYNC_LOCK)
     def __repr__(self) -> str:
         return str(dict(self._items_dict.items()))
 
+    def _position(self, object_id: int) -> int:
+        """Like list.index, but without scanning the list."""
+        try:
+            return self._index_map[object_id]
+        except KeyError:
+            raise ValueError(f"{object_id} is not in list") from None
+
     def _swap(self, index1: int, index2: int) -> None:
         self._items_list[index1], self._items_list[index2] = (
             self._items_list[index2],
             self._items_list[index1],
         )
+        self._items_ordered[index1], self._items_ordered[index2] = (
+            self._items_ordered[index2],
+            self._items_ordered[index1],
+        )
+        self._index_map[self._items_list[index1]] = index1
+        self._index_map[self._items_list[index2]] = index2
 
 
 class DownloadManager(Thread):
     """Manages the download process.
 
     Attributes:
-        WAIT_TIME (float): Time in seconds to sleep.
+        WAIT_TIME (float): Maximum time in seconds to wait for a change
+            in the download list or an idle worker.
 
     Args:
         parent (mainframe.MainFrame): Main Frame
@@ -378,7 +427,7 @@ class DownloadManager(Thread):
 
     """
 
-    WAIT_TIME = 0.1
+    WAIT_TIME = 1.0
 
     def __init__(
         self,
@@ -397,13 +446,26 @@ class DownloadManager(Thread):
         self._time_it_took: float = 0
         self._successful = 0
         self._running = True
+        # The binary path does not change while the downloads are running
+        self._ytdl_path = self._youtubedl_path()
 
         # Init the custom workers thread pool
         self._workers = [
-            Worker(opt_manager, self._youtubedl_path(), log_manager, worker=worker)
+            Worker(
+                opt_manager,
+                self._ytdl_path,
+                log_manager,
+                worker=worker,
+                on_idle=self._on_worker_idle,
+            )
             for worker in range(1, int(opt_manager.options["workers_number"]) + 1)
         ]
 
+        # Workers without a job, taken by _get_worker() and given back
+        # by _on_worker_idle() once their download is over
+        self._idle_lock = Lock()
+        self._idle_workers: deque[Worker] = deque(self._workers)
+
         self.name = "DownloadManager"
         self.daemon = daemon
         self.start()
@@ -425,7 +487,6 @@ class DownloadManager(Thread):
 
         self._time_it_took = time.time()
 
-        # TODO: Use threading.Condition
         while self._running:
             item: DownloadItem | None = self.download_list.fetch_next()
 
@@ -435,11 +496,14 @@ class DownloadManager(Thread):
                 if worker is not None:
                     worker.download(item.url, item.options, item.object_id)
                     self.download_list.change_stage(item.object_id, "Active")
+                    continue
 
-            if item is None and self._jobs_done():
+            elif self._jobs_done():
                 break
 
-            time.sleep(self.WAIT_TIME)
+            # Sleep until an item gets queued or a worker becomes idle, the
+            # timeout covers the items re-queued with DownloadItem.reset()
+            self.download_list.wait(self.WAIT_TIME)
 
         # Close all the workers and collect
         for worker in self._workers:
@@ -468,6 +532,7 @@ class DownloadManager(Thread):
         """
         self._talk_to_gui("closing")
         self._running = False
+        self.download_list.notify()
 
     def send_to_worker(self, data: dict[str, Any]) -> None:
         """Send data to the Workers.
@@ -476,7 +541,7 @@ class DownloadManager(Thread):
             data (dict): Python dictionary that holds the 'index'
             which is used to identify the Worker thread and the data which
             can be any of the Worker's class valid data. For a list of valid
-            data keys see __init__() under the Worker class.
+            data keys see the _WorkerState class.
 
         """
         if "index" in data:
@@ -508,18 +573,25 @@ class DownloadManager(Thread):
 
     def _check_youtubedl(self) -> None:
         """Check if youtube-dl binary exists. If not try to download it."""
-        ytdl_path = self._youtubedl_path()
-        if not Path(ytdl_path).exists() and self.parent.update_thread is None:
+        if not Path(self._ytdl_path).exists() and self.parent.update_thread is None:
             self.parent.update_thread = UpdateThread(self.opt_manager, True)
             self.parent.update_thread.join()
             self.parent.update_thread = None
 
     def _get_worker(self) -> Worker | None:
-        return next((worker for worker in self._workers if worker.available()), None)
+        with self._idle_lock:
+            return self._idle_workers.popleft() if self._idle_workers else None
+
+    def _on_worker_idle(self, worker: Worker) -> None:
+        """Callback method for the workers, called when a job is over."""
+        with self._idle_lock:
+            self._idle_workers.append(worker)
+
+        self.download_list.notify()
 
     def _jobs_done(self) -> bool:
         """Returns True if the workers have finished their jobs else False."""
-        return all(worker.available() for worker in self._workers)
+        return len(self._idle_workers) == len(self._workers)
 
     def _youtubedl_path(self) -> str:
         """Returns the path to youtube-dl binary."""
@@ -530,15 +602,41 @@ class DownloadManager(Thread):
         return f"<{self.__class__.__name__}({self.download_list})>"
 
 
+class _WorkerState:
+    """Download data a Worker receives back from the GUI."""
+
+    __slots__ = (
+        "playlist_index",
+        "playlist_size",
+        "new_filename",
+        "extension",
+        "filesize",
+        "filename",
+        "percent",
+        "status",
+        "speed",
+        "path",
+        "eta",
+    )
+
+    def __init__(self):
+        self.playlist_index: str | None = None
+        self.playlist_size: str | None = None
+        self.new_filename: str | None = None
+        self.extension: str | None = None
+        self.filesize: str | None = None
+        self.filename: str | None = None
+        self.percent: str | None = None
+        self.status: str | None = None
+        self.speed: str | None = None
+        self.path: str | None = None
+        self.eta: str | None = None
+
+
 class Worker(Thread):
     """Simple worker which downloads the given url using a downloader
     from the downloaders.py module.
 
-    Attributes:
-        WAIT_TIME (float): Time in seconds to sleep.
-
-        worker_count (int): Numer of worker threads
-
     Args:
         opt_manager (optionsmanager.OptionsManager): Check DownloadManager
             description.
@@ -548,31 +646,32 @@ class Worker(Thread):
         log_manager (logmanager.LogManager): Check DownloadManager
             description.
 
-        worker (int): Worker thread number
+        worker (int): Worker thread number, if not given the next
+            number from a module wide counter is used.
+
+        on_idle (Callable): Optional callback function called with the
+            worker every time it finishes a download.
 
     Note:
-        For available data keys see self._data under the __init__() method.
+        For available data keys see the _WorkerState class.
 
     """
 
-    WAIT_TIME = 0.1
-    worker_count = 0
-
     def __init__(
         self,
         opt_manager: OptionsManager,
         youtubedl_path: str,
         log_manager: LogManager | None = None,
         worker: int | None = None,
+        on_idle: Callable[[Worker], None] | None = None,
     ):
         super().__init__()
         # Use Daemon ?
         # self.setDaemon(True)
-        Worker.worker_count += 1
         self.opt_manager = opt_manager
         self.log_manager = log_manager
-        self.worker = worker or Worker.worker_count
-        self.setName(f"Worker_{worker}")
+        self.worker = worker if worker is not None else next(_worker_counter)
+        self.name = f"Worker_{self.worker}"
 
         self._downloader = YoutubeDLDownloader(
             youtubedl_path, self._data_hook, self._log_data
@@ -580,44 +679,43 @@ class Worker(Thread):
         self._options_parser = OptionsParser()
         self._successful = 0
         self._running = True
+        self._url: str | None = None
+        self._index: int | None = None
         self._options: list[str] | None = None
 
         self._wait_for_reply = False
 
-        self._data: dict[str, Any] = {
-            "playlist_index": None,
-            "playlist_size": None,
-            "new_filename": None,
-            "extension": None,
-            "filesize": None,
-            "filename": None,
-            "percent": None,
-            "status": None,
-            "index": None,
-            "speed": None,
-            "path": None,
-            "eta": None,
-            "url": None,
-        }
+        self._on_idle = on_idle
+        # Jobs handed over by download(), close() puts None to wake us up
+        self._jobs: Queue[tuple[str, list[str], int] | None] = Queue()
+
+        self._data = _WorkerState()
 
         self.start()
 
     def run(self) -> None:
-        # TODO: Use threading.Condition
         while self._running:
-            if self._data.get("url"):
-                ret_code = self._downloader.download(self._data["url"], self._options)
+            # Sleep until download() hands over a job or close() is called
+            job = self._jobs.get()
+
+            if job is None or not self._running:
+                break
+
+            self._url, self._options, self._index = job
+
+            ret_code = self._downloader.download(self._url, self._options)
 
-                if ret_code in [
-                    YoutubeDLDownloader.OK,
-                    YoutubeDLDownloader.ALREADY,
-                    YoutubeDLDownloader.WARNING,
-                ]:
-                    self._successful += 1
+            if ret_code in [
+                YoutubeDLDownloader.OK,
+                YoutubeDLDownloader.ALREADY,
+                YoutubeDLDownloader.WARNING,
+            ]:
+                self._successful += 1
 
-                self._reset()
+            self._reset()
 
-            time.sleep(self.WAIT_TIME)
+            if self._on_idle is not None:
+                self._on_idle(self)
 
         # Call the destructor function of YoutubeDLDownloader object
         self._downloader.close()
@@ -634,9 +732,7 @@ class Worker(Thread):
                 download process.
 
         """
-        self._data["url"] = url
-        self._options = options
-        self._data["index"] = object_id
+        self._jobs.put((url, options, object_id))
 
     def stop_download(self) -> None:
         """Stop the download process of the worker."""
@@ -646,20 +742,23 @@ class Worker(Thread):
         """Kill the worker after stopping the download process."""
         self.stop_download()
         self._running = False
+        self._jobs.put(None)
 
     def available(self) -> bool:
         """Return True if the worker has no job else False."""
-        return self._data["url"] is None
+        return self._url is None and self._jobs.empty()
 
     def has_index(self, index) -> bool:
-        """Return True if index is equal to self._data['index'] else False."""
-        return self._data["index"] == index
+        """Return True if index is equal to the index of the current job."""
+        return self._index == index
 
     def update_data(self, data: dict[str, Any]) -> None:
         """Update self._data from the given data."""
         if self._wait_for_reply:
             # Update data only if a receive request has been issued
-            self._data.update(data)
+            for key, value in data.items():
+                if key in _WorkerState.__slots__:
+                    setattr(self._data, key, value)
 
             self._wait_for_reply = False
 
@@ -669,9 +768,11 @@ class Worker(Thread):
         return self._successful
 
     def _reset(self) -> None:
-        """Reset self._data back to the original state."""
-        for key in self._data:
-            self._data[key] = None
+        """Reset the current job and self._data back to the original state."""
+        self._url = None
+        self._index = None
+        self._options = None
+        self._data = _WorkerState()
 
     def _log_data(self, data: str) -> None:
         """Callback method for self._downloader.
@@ -732,7 +833,7 @@ class Worker(Thread):
             ('receive', {'index': <item_row>, 'source': 'source_key', 'dest': 'destination_key'})
 
         """
-        data["index"] = self._data["index"]
+        data["index"] = self._index
 
         if signal == "receive":
             self._wait_for_reply = True
@@ -2,16 +2,113 @@
 
 
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from queue import Empty, Queue
 
 from .utils import check_path, get_encoding  # type: ignore[attr-defined]
 
 
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that writes through a bigger buffer.
+
+    emit() does not flush the stream, _BufferedQueueListener calls
+    flush_buffer() at most every FLUSH_INTERVAL seconds. The size of the
+    file is kept in a running count, seeking to the end of the stream to
+    check for a rollover would flush the buffer on every record.
+
+    """
+
+    BUFFER_SIZE = 65536  # Bytes
+
+    def __init__(self, filename: str, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+
+        try:
+            self._size = os.stat(self.baseFilename).st_size
+        except FileNotFoundError:
+            self._size = 0
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+        )
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.maxBytes <= 0:
+            return False
+
+        length = len(self.format(record)) + len(self.terminator)
+
+        # Never rollover an empty file
+        if self._size and self._size + length >= self.maxBytes:
+            # The record goes to the new file
+            self._size = length
+            return True
+
+        self._size += length
+        return False
+
+    def flush(self) -> None:
+        """Keep the records in the buffer, see flush_buffer()."""
+
+    def flush_buffer(self) -> None:
+        super().flush()
+
+    def truncate(self) -> None:
+        """Empty the log file, dropping the records still in the buffer."""
+        self.acquire()
+        try:
+            if self.stream is not None:
+                stream, self.stream = self.stream, None
+                stream.close()
+
+            with open(self.baseFilename, "w", encoding=self.encoding):
+                pass
+
+            self._size = 0
+        finally:
+            self.release()
+
+
+class _BufferedQueueListener(QueueListener):
+    """QueueListener that flushes the buffered handlers at most once every
+    FLUSH_INTERVAL seconds, and no later than that after the last record."""
+
+    FLUSH_INTERVAL = 0.5  # Seconds
+
+    def __init__(self, queue: Queue, *handlers: logging.Handler):
+        super().__init__(queue, *handlers)
+        self._flushed_at = time.monotonic()
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        timeout = self.FLUSH_INTERVAL - (time.monotonic() - self._flushed_at)
+
+        if timeout > 0:
+            try:
+                return self.queue.get(block, timeout)
+            except Empty:
+                pass
+
+        for handler in self.handlers:
+            if isinstance(handler, _BufferedRotatingFileHandler):
+                handler.flush_buffer()
+
+        self._flushed_at = time.monotonic()
+        return self.queue.get(block)
+
+
 class LogManager:
     """Simple log manager for youtube-dl.
 
-    This class is mainly used to log the youtube-dl STDERR.
+    This class is mainly used to log the youtube-dl STDERR. The records are
+    written to the log file by a background thread, so log() never waits
+    on the disk.
 
     Attributes:
         LOG_FILENAME (str): Filename of the log file.
@@ -38,11 +135,12 @@ class LogManager:
 
         check_path(self.config_path)
 
-        self.handler = RotatingFileHandler(
+        self.handler = _BufferedRotatingFileHandler(
             filename=self.log_file,
             maxBytes=LogManager.MAX_LOGSIZE,
             backupCount=5,
             encoding=self._encoding,
+            delay=True,
         )
 
         fmt = "%(levelname)s-%(threadName)s-%(message)s"
@@ -51,18 +149,30 @@ class LogManager:
             fmt = f"%(asctime)s-{fmt}"
 
         self.handler.setFormatter(logging.Formatter(fmt=fmt))
-        self.logger.addHandler(self.handler)
+
+        self._queue: Queue = Queue()
+        self._queue_handler = QueueHandler(self._queue)
+        self.logger.addHandler(self._queue_handler)
+
+        self._listener = _BufferedQueueListener(self._queue, self.handler)
+        self._listener.start()
 
     def log_size(self) -> int:
         """Return log file size in Bytes."""
-        path = Path(self.log_file)
-
-        return path.stat().st_size if path.exists() else 0
+        try:
+            return os.stat(self.log_file).st_size
+        except FileNotFoundError:
+            return 0
 
     def clear(self) -> None:
         """Clear log file."""
-        with open(self.log_file, "w") as log:
-            log.write("")
+        self.handler.truncate()
+
+    def close(self) -> None:
+        """Write the pending records and stop the background thread."""
+        self._listener.stop()
+        self.logger.removeHandler(self._queue_handler)
+        self.handler.close()
 
     def log(self, data: str) -> None:
         """Log data to the log file.
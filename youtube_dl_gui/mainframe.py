@@ -1432,6 +1432,9 @@ class MainFrame(wx.Frame):
         if self.update_thread:
             self.update_thread.join()
 
+        if self.log_manager is not None:
+            self.log_manager.close()
+
         # Store main-options frame size
         self.opt_manager.options["main_win_size"] = self.GetSize()
         self.opt_manager.options["opts_win_size"] = self._options_frame.GetSize()
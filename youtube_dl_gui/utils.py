@@ -12,6 +12,7 @@ import math
 import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from .info import __appname__
@@ -35,6 +36,7 @@ locale_getdefaultlocale = locale.getdefaultlocale
 locale_getpreferredencoding = locale.getpreferredencoding
 
 
+@lru_cache(maxsize=1)
 def get_encoding() -> str:
     """Return system encoding, elsese utf-8"""
     try:
@@ -109,6 +111,7 @@ def check_path(path: str) -> None:
 
 
 # noinspection PyUnusedLocal
+@lru_cache(maxsize=1)
 def get_config_path() -> str:
     """Return user config path.
 
@@ -209,6 +212,7 @@ def get_search_dirs(dir_name: str) -> list[Path]:
 
 
 # noinspection PyPep8Naming
+@lru_cache(maxsize=1)
 def get_locale_file() -> str | None:
     """Search for yt_dlg locale file.
 
@@ -250,6 +254,7 @@ def get_icon_file() -> str | None:
 
 
 # noinspection PyPep8Naming
+@lru_cache(maxsize=1)
 def get_pixmaps_dir() -> str | None:
     """Return absolute path to the pixmaps icons folder.
 
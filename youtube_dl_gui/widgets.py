@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import contextlib
+import re
 from datetime import timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
@@ -20,6 +20,9 @@ if TYPE_CHECKING:
 
 _: Callable[[str], str] = wx.GetTranslation
 
+# External downloader args written by the ClipDialog: -ss <start> -to <end>
+_TIMESPAN_RE = re.compile(r"\s*['\"]?-ss\s+(\S+)\s+-to\s+(\S+)\s*")
+
 
 def crt_command_event(event: wx.PyEventBinder, event_id: int = 0) -> wx.CommandEvent:
     """Shortcut to create command events."""
@@ -598,19 +601,22 @@ class ClipDialog(wx.Dialog):
 
         """
         options = []
+        skip_next = False
+
+        for opt in self.download_item.options:
+            if skip_next:
+                skip_next = False
+                if opt == "ffmpeg" or "-ss" in opt or "-to" in opt:
+                    continue
 
-        for idx, opt in enumerate(self.download_item.options):
             if opt in self.CHECK_OPTIONS:
-                with contextlib.suppress(IndexError):
-                    opt_arg = self.download_item.options[idx + 1]
-                    if opt_arg == "ffmpeg" or "-ss" in opt_arg or "-to" in opt_arg:
-                        self.download_item.options.pop(idx + 1)
+                skip_next = True
                 continue
 
             options.append(opt)
 
-        if options:
-            self.download_item.options = options
+        # Assign once instead of popping from the list while iterating it
+        self.download_item.options = options
 
     def _get_timespans(self) -> tuple[str, str]:
         """
@@ -621,7 +627,6 @@ class ClipDialog(wx.Dialog):
 
         """
         external_downloader_args: str | None = None
-        downloader_args: list[str] | None = None
         clip_start = clip_end = index = 0
 
         for idx, option in enumerate(self.download_item.options):
@@ -634,14 +639,17 @@ class ClipDialog(wx.Dialog):
                     self.download_item.options.pop(idx)
                 break
 
-        if external_downloader_args:
-            downloader_args = external_downloader_args.split()
+        match = (
+            _TIMESPAN_RE.fullmatch(external_downloader_args)
+            if external_downloader_args
+            else None
+        )
 
-        if downloader_args and len(downloader_args) == 4:
+        if match:
             # Clean quotes (simple/double)
             try:
-                clip_start = int(downloader_args[1].strip("'\""))
-                clip_end = int(downloader_args[-1].strip("'\""))
+                clip_start = int(match[1].strip("'\""))
+                clip_end = int(match[2].strip("'\""))
             except ValueError:
                 self.download_item.options.pop(index + 1)
                 self.download_item.options.pop(index)